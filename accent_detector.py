@@ -7,33 +7,240 @@ from video URLs or local audio/video files using a pretrained
 SpeechBrain accent classification model.
 """
 
+import contextlib
 import os
+import shutil
+import struct
+import subprocess
 import tempfile
+import wave
+from functools import lru_cache
+from itertools import chain
 import requests
-from typing import Optional, Dict, Any
-from moviepy import VideoFileClip
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
+
+# Concurrent Streamlit sessions each run their own short inference; one BLAS/OpenMP
+# thread per request avoids thread-pool oversubscription. Must be set before torch
+# is imported. Set ACCENT_SINGLE_THREAD=0 to keep the library defaults.
+SINGLE_THREAD = os.environ.get("ACCENT_SINGLE_THREAD", "1") != "0"
+if SINGLE_THREAD:
+    os.environ.setdefault("OMP_NUM_THREADS", "1")
+    os.environ.setdefault("MKL_NUM_THREADS", "1")
+
+import numpy as np
+import torch
+import torchaudio
 from speechbrain.pretrained import EncoderClassifier
 import streamlit as st
 
+try:
+    import soxr
+except ImportError:  # optional; torchaudio is used instead
+    soxr = None
+
+try:
+    import imageio_ffmpeg
+except ImportError:  # optional; only an ffmpeg binary on PATH is used
+    imageio_ffmpeg = None
+
+
+SAMPLE_RATE = 16000
+MAX_SECONDS = 30.0
+DOWNLOAD_WORKERS = 4
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+if SINGLE_THREAD:
+    torch.set_num_threads(1)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Can only be set once per process, before any inter-op work has started
+        pass
+
+# Shared session so repeated downloads reuse keep-alive connections. Video is
+# already compressed, so ask servers not to gzip it (keeps ranges byte-exact).
+_SESSION = requests.Session()
+_SESSION.headers["Accept-Encoding"] = "identity"
+for _scheme in ("http://", "https://"):
+    _SESSION.mount(_scheme, HTTPAdapter(pool_connections=8, pool_maxsize=32))
+
+
+def get_device() -> str:
+    """
+    Pick the device used for inference.
+
+    The ``ACCENT_DEVICE`` environment variable takes precedence; otherwise
+    CUDA is used when available, falling back to CPU.
+
+    Returns:
+        str: Torch device string (e.g. "cuda" or "cpu").
+    """
+    return os.environ.get("ACCENT_DEVICE") or ("cuda" if torch.cuda.is_available() else "cpu")
+
+
+def _inference_context(device: str) -> contextlib.ExitStack:
+    """Enter inference mode, plus FP16 autocast when running on CUDA."""
+    stack = contextlib.ExitStack()
+    stack.enter_context(torch.inference_mode())
+    stack.enter_context(torch.autocast(
+        device_type="cuda" if device.startswith("cuda") else "cpu",
+        dtype=torch.float16,
+        enabled=device.startswith("cuda"),
+    ))
+    return stack
+
 
 @st.cache_resource(show_spinner=False)
 def get_classifier() -> EncoderClassifier:
     """
     Load and cache the pre-trained accent classifier model from HuggingFace.
+
+    The device must be passed through ``run_opts`` at construction time;
+    SpeechBrain does not move its modules on a later ``.to()`` call. On CPU
+    the transformer encoder's Linear layers are dynamically quantized to
+    int8; the convolutional feature extractor stays in FP32. The encoder is
+    then wrapped with ``torch.compile`` (on by default on CUDA only; set
+    ``ACCENT_COMPILE`` to 1 or 0 to override), and one dummy batch is run so
+    kernel selection, allocator growth and compilation happen when the model
+    is loaded. If that batch fails under, or never reaches, the compiled
+    encoder, the eager modules are restored.
+
     Returns:
         EncoderClassifier: SpeechBrain encoder classifier instance.
     """
-    return EncoderClassifier.from_hparams(
+    device = get_device()
+    classifier = EncoderClassifier.from_hparams(
         source="Jzuluaga/accent-id-commonaccent_xlsr-en-english",
         savedir="tmp/accent_classification_model",
-        run_opts={"device":"cpu"},
+        run_opts={"device": device},
     )
 
+    if device == "cpu":
+        wav2vec2 = classifier.mods.wav2vec2.model
+        wav2vec2.encoder = torch.ao.quantization.quantize_dynamic(
+            wav2vec2.encoder, {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+    # CUDA-graph modes ("reduce-overhead") would re-record a graph and memory
+    # pool for every distinct clip length, so only the default mode is used.
+    # Compiling over the int8-quantized CPU encoder is opt-in.
+    originals: Dict[str, torch.nn.Module] = {}
+    compile_default = "1" if device.startswith("cuda") else "0"
+    if os.environ.get("ACCENT_COMPILE", compile_default) != "0":
+        torch._dynamo.config.cache_size_limit = 8
+        originals = _compile_encoder(classifier)
+
+    try:
+        compiled_calls = _warm_up(classifier, device, list(originals))
+    except Exception:
+        if not originals:
+            raise
+        # Compilation failed; keep the eager modules
+        compiled_calls = 0
+    if originals and compiled_calls == 0:
+        classifier.mods.update(originals)
+        _warm_up(classifier, device)
+
+    return classifier
+
+
+def _compile_encoder(classifier: EncoderClassifier) -> Dict[str, torch.nn.Module]:
+    """
+    Wrap the waveform encoder with ``torch.compile`` where encode_batch calls it.
+
+    ``encode_batch`` never looks up ``mods.wav2vec2``; it reaches the encoder
+    through other keys (``compute_features``/``embedding_model``) that alias
+    the same module. Every such alias is replaced by one compiled wrapper; if
+    none exists, ``compute_features`` itself is compiled.
+
+    Args:
+        classifier (EncoderClassifier): Loaded classifier, modified in place.
+
+    Returns:
+        Dict[str, torch.nn.Module]: Eager module for each replaced ``mods`` key.
+    """
+    mods = classifier.mods
+    encoder = mods["wav2vec2"] if "wav2vec2" in mods else mods["compute_features"]
+    keys = [key for key, module in mods.items() if module is encoder and key != "wav2vec2"]
+    if not keys:
+        encoder, keys = mods["compute_features"], ["compute_features"]
+
+    compiled = torch.compile(encoder, dynamic=True)
+    originals = {}
+    for key in keys:
+        originals[key] = mods[key]
+        mods[key] = compiled
+    return originals
+
+
+def _warm_up(classifier: EncoderClassifier, device: str, watch: Optional[List[str]] = None) -> int:
+    """
+    Run one dummy batch so kernels, allocators and compiled graphs are ready.
+
+    Args:
+        classifier (EncoderClassifier): Classifier to run.
+        device (str): Device the classifier lives on.
+        watch (Optional[List[str]]): ``mods`` keys whose calls are counted.
+
+    Returns:
+        int: Number of calls made to the watched modules during the run.
+    """
+    calls = []
+    handles = [
+        classifier.mods[key].register_forward_pre_hook(lambda *_: calls.append(None))
+        for key in watch or []
+    ]
+    try:
+        with _inference_context(device):
+            classifier.encode_batch(
+                torch.zeros(1, SAMPLE_RATE, device=device), torch.ones(1, device=device)
+            )
+        if device.startswith("cuda"):
+            torch.cuda.synchronize()
+    finally:
+        for handle in handles:
+            handle.remove()
+    return len(calls)
+
+
+def _download_range(url: str, path: str, start: int, end: int, timeout: int) -> None:
+    """
+    Fetch bytes ``start..end`` (inclusive) of ``url`` into the same offset of ``path``.
+
+    Raises:
+        requests.RequestException: If the request fails or the server does not
+            return exactly the requested range.
+    """
+    headers = {"Range": f"bytes={start}-{end}"}
+    with _SESSION.get(url, headers=headers, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        if response.status_code != 206:
+            raise requests.RequestException("Server ignored the Range header")
+        content_range = response.headers.get("Content-Range", "")
+        if not content_range.startswith(f"bytes {start}-{end}/"):
+            raise requests.RequestException(f"Unexpected Content-Range: {content_range!r}")
+
+        written = 0
+        with open(path, "r+b") as out:
+            out.seek(start)
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                out.write(chunk)
+                written += len(chunk)
+        if written != end - start + 1:
+            raise requests.RequestException(
+                f"Range {start}-{end} returned {written} of {end - start + 1} bytes"
+            )
+
 
 def download_video(url: str, timeout: int = 15) -> str:
     """
     Download video from a public URL to a temporary file.
-    
+
+    Large files on servers that support byte ranges are fetched as several
+    concurrent range requests; otherwise a single streamed GET is used.
+
     Args:
         url (str): URL of the video.
         timeout (int): Timeout for the request in seconds.
@@ -44,13 +251,200 @@ def download_video(url: str, timeout: int = 15) -> str:
     Raises:
         requests.RequestException: If download fails.
     """
-    response = requests.get(url, stream=True, timeout=timeout)
-    response.raise_for_status()
+    head = _SESSION.head(url, allow_redirects=True, timeout=timeout)
+    size = int(head.headers.get("Content-Length", 0)) if head.ok else 0
+    ranged = head.ok and head.headers.get("Accept-Ranges") == "bytes"
+
     with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as tmp_file:
-        for chunk in response.iter_content(chunk_size=8192):
-            if chunk:
-                tmp_file.write(chunk)
-        return tmp_file.name
+        path = tmp_file.name
+
+    try:
+        if ranged and size >= DOWNLOAD_WORKERS * DOWNLOAD_CHUNK_SIZE:
+            os.truncate(path, size)
+            step = -(-size // DOWNLOAD_WORKERS)
+            try:
+                with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+                    futures = [
+                        pool.submit(_download_range, head.url, path, start, min(start + step, size) - 1, timeout)
+                        for start in range(0, size, step)
+                    ]
+                    for future in futures:
+                        future.result()
+                return path
+            except requests.RequestException:
+                # Fall back to a single connection below
+                pass
+
+        with _SESSION.get(url, stream=True, timeout=timeout) as response:
+            response.raise_for_status()
+            with open(path, "wb") as tmp_file:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if chunk:
+                        tmp_file.write(chunk)
+    except BaseException:
+        cleanup_files(path)
+        raise
+    return path
+
+
+def _ffmpeg_exe() -> Optional[str]:
+    """Locate an ffmpeg binary: PATH first, then the one bundled with imageio-ffmpeg."""
+    exe = shutil.which("ffmpeg")
+    if exe is None and imageio_ffmpeg is not None:
+        try:
+            exe = imageio_ffmpeg.get_ffmpeg_exe()
+        except RuntimeError:
+            pass
+    return exe
+
+
+class FFmpegError(subprocess.CalledProcessError):
+    """CalledProcessError whose message includes the end of FFmpeg's stderr."""
+
+    def __str__(self) -> str:
+        stderr = self.stderr or b""
+        if isinstance(stderr, bytes):
+            stderr = stderr.decode(errors="replace")
+        detail = stderr.strip().splitlines()[-3:]
+        message = super().__str__()
+        return f"{message.rstrip('.')}: {' | '.join(detail)}" if detail else message
+
+
+def _ffmpeg_args(source: str, audio_path: str) -> List[str]:
+    """Build the FFmpeg command decoding ``source`` to 16 kHz mono PCM16 WAV."""
+    # stdin is only ever the piped input; never read terminal keys from it
+    interactive = [] if source == "pipe:0" else ["-nostdin"]
+    return [
+        _ffmpeg_exe() or "ffmpeg", *interactive,
+        "-hide_banner", "-loglevel", "error", "-y", "-threads", "0",
+        "-i", source,
+        "-vn", "-ac", "1", "-ar", str(SAMPLE_RATE),
+        "-f", "wav", "-acodec", "pcm_s16le",
+        audio_path,
+    ]
+
+
+def download_audio(url: str, video_path: str, timeout: int = 15) -> str:
+    """
+    Stream a video from a public URL into FFmpeg and save its audio as WAV.
+
+    The download is piped to FFmpeg's stdin, so decoding overlaps with the
+    network transfer. Every chunk is also written to ``video_path``: if the
+    container can't be demuxed from a pipe, that copy can be decoded with
+    ``extract_audio`` instead of downloading the video a second time. If
+    FFmpeg exits early the download still runs to completion into that file.
+
+    Args:
+        url (str): URL of the video.
+        video_path (str): Path to write the downloaded video to (overwritten).
+        timeout (int): Timeout for the request in seconds.
+
+    Returns:
+        str: Path to the temporary WAV audio file.
+
+    Raises:
+        requests.RequestException: If download fails.
+        FFmpegError: If FFmpeg cannot decode the stream (e.g. an MP4 whose
+            index is stored at the end of the file); ``video_path`` then
+            holds the complete video.
+    """
+    with _SESSION.get(url, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as audio_file:
+            audio_path = audio_file.name
+
+        proc = None
+        # A file rather than a pipe, so an unread stderr can't block FFmpeg
+        stderr_file = tempfile.TemporaryFile()
+        try:
+            proc = subprocess.Popen(
+                _ffmpeg_args("pipe:0", audio_path),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=stderr_file,
+            )
+            piping = True
+            with open(video_path, "wb") as video_file:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if not chunk:
+                        continue
+                    video_file.write(chunk)
+                    if piping:
+                        try:
+                            proc.stdin.write(chunk)
+                        except BrokenPipeError:
+                            # FFmpeg exited early; its return code is checked below
+                            piping = False
+            if piping:
+                try:
+                    proc.stdin.close()
+                except BrokenPipeError:
+                    pass
+            returncode = proc.wait()
+        except BaseException:
+            if proc is not None:
+                proc.kill()
+                proc.wait()
+            stderr_file.close()
+            cleanup_files(audio_path)
+            raise
+
+    with stderr_file:
+        stderr_file.seek(0)
+        stderr = stderr_file.read()
+    if returncode != 0:
+        cleanup_files(audio_path)
+        raise FFmpegError(returncode, proc.args, stderr=stderr)
+    return audio_path
+
+
+def _pyav_extract(video_path: str, audio_path: str) -> None:
+    """
+    Decode the first audio stream of a media file to 16 kHz mono PCM16 WAV with PyAV.
+
+    Args:
+        video_path (str): Path to the input media file.
+        audio_path (str): Path of the WAV file to write (overwritten).
+    """
+    import av
+
+    resampler = av.AudioResampler(format="s16", layout="mono", rate=SAMPLE_RATE)
+    with av.open(video_path) as container, wave.open(audio_path, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+
+        frames = container.decode(container.streams.audio[0])
+        for frame in chain(frames, [None]):
+            # A final None flushes samples buffered inside the resampler
+            for out in resampler.resample(frame):
+                wav.writeframes(out.to_ndarray().tobytes())
+
+
+def ffmpeg_extract(video_path: str, audio_path: str) -> None:
+    """
+    Decode the audio track of a media file to 16 kHz mono PCM16 WAV with FFmpeg.
+
+    Falls back to PyAV (which bundles libav) when no ``ffmpeg`` binary is found,
+    neither on PATH nor from imageio-ffmpeg.
+
+    Args:
+        video_path (str): Path to the input media file.
+        audio_path (str): Path of the WAV file to write (overwritten).
+
+    Raises:
+        FFmpegError: If FFmpeg fails; its message carries FFmpeg's error output.
+    """
+    if _ffmpeg_exe() is None:
+        _pyav_extract(video_path, audio_path)
+        return
+    proc = subprocess.run(
+        _ffmpeg_args(video_path, audio_path),
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+    )
+    if proc.returncode != 0:
+        raise FFmpegError(proc.returncode, proc.args, output=proc.stdout, stderr=proc.stderr)
 
 
 def extract_audio(video_path: str) -> str:
@@ -67,68 +461,322 @@ def extract_audio(video_path: str) -> str:
         Exception: If audio extraction fails.
     """
     with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as audio_file:
-        video = VideoFileClip(video_path)
-        video.audio.write_audiofile(
-            audio_file.name,
-            verbose=False,
-            logger=None,
-            codec="pcm_s16le",
-            fps=16000,
-        )
-        return audio_file.name
+        audio_path = audio_file.name
+    ffmpeg_extract(video_path, audio_path)
+    return audio_path
+
 
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+_KSDATAFORMAT_SUBTYPE_PCM = bytes.fromhex("0100000000001000800000aa00389b71")
 
-def classify_accent(audio_path: str) -> Dict[str, Any]:
+
+def _mmap_wav(audio_path: str) -> Optional[Tuple[np.ndarray, int]]:
     """
-    Classify the English accent from an audio file.
+    Memory-map the samples of a PCM16 WAV file without reading them.
 
     Args:
-        audio_path (str): Path to the audio WAV file.
+        audio_path (str): Path to the audio file.
+
+    Returns:
+        Optional[Tuple[np.ndarray, int]]: ``int16`` array of shape
+        ``[time, channels]`` backed by the file, and its sample rate; None if
+        the file is not a PCM16 WAV.
+    """
+    file_size = os.path.getsize(audio_path)
+    with open(audio_path, "rb") as f:
+        header = f.read(12)
+        if len(header) < 12:
+            return None
+        riff, _, wave_id = struct.unpack("<4sI4s", header)
+        if riff != b"RIFF" or wave_id != b"WAVE":
+            return None
+        fmt = None
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                return None
+            chunk_id, chunk_size = struct.unpack("<4sI", header)
+            if chunk_id == b"fmt ":
+                # Basic fields, plus the WAVE_FORMAT_EXTENSIBLE extension if present
+                fmt_bytes = f.read(min(chunk_size, 40))
+                if chunk_size < 16 or len(fmt_bytes) < min(chunk_size, 40):
+                    return None
+                fmt = fmt_bytes
+                f.seek(chunk_size - len(fmt_bytes) + (chunk_size & 1), os.SEEK_CUR)
+            elif chunk_id == b"data":
+                offset = f.tell()
+                break
+            else:
+                f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+
+    if fmt is None:
+        return None
+    format_tag, channels, sr, _, _, bits = struct.unpack_from("<HHIIHH", fmt)
+    if format_tag == _WAVE_FORMAT_EXTENSIBLE:
+        # The real format is the SubFormat GUID at the end of the extension
+        if len(fmt) < 40 or fmt[24:40] != _KSDATAFORMAT_SUBTYPE_PCM:
+            return None
+    elif format_tag != _WAVE_FORMAT_PCM:
+        return None
+    if bits != 16 or channels == 0 or sr == 0:
+        return None
+
+    # Streamed WAVs may carry a placeholder size; trust the file length instead
+    frames = min(chunk_size, file_size - offset) // (2 * channels)
+    if frames == 0:
+        return None
+    samples = np.memmap(audio_path, dtype="<i2", mode="c", offset=offset, shape=(frames, channels))
+    return samples, sr
+
+
+def open_audio(audio_path: str) -> Tuple[torch.Tensor, int]:
+    """
+    Open an audio file as a ``[channels, time]`` waveform and its sample rate.
+
+    PCM16 WAVs (what this module extracts) are memory-mapped and returned as
+    an ``int16`` tensor view, so only the parts that are used get read; other
+    formats are decoded with ``torchaudio.load``.
+
+    Args:
+        audio_path (str): Path to the audio file.
+
+    Returns:
+        Tuple[torch.Tensor, int]: Waveform and sample rate.
+    """
+    mapped = _mmap_wav(audio_path)
+    if mapped is None:
+        return torchaudio.load(audio_path)
+    samples, sr = mapped
+    return torch.from_numpy(samples).T, sr
+
+
+def prepare_waveform(
+    sig: torch.Tensor, sr: int, max_seconds: Optional[float] = None
+) -> torch.Tensor:
+    """
+    Turn an already-loaded waveform into the model's mono 16 kHz input.
+
+    Args:
+        sig (torch.Tensor): Waveform of shape ``[channels, time]``, float or int16.
+        sr (int): Sample rate of ``sig``.
+        max_seconds (Optional[float]): If set, keep only a window of this
+            length from the middle of the waveform.
+
+    Returns:
+        torch.Tensor: Waveform of shape ``[1, time]``.
+    """
+    if max_seconds is not None:
+        window = int(max_seconds * sr)
+        if 0 < window < sig.shape[-1]:
+            start = (sig.shape[-1] - window) // 2
+            sig = sig[:, start:start + window]
+    if not sig.is_floating_point():
+        # Only the selected window of a memory-mapped int16 file is copied here
+        sig = sig.contiguous().float().div_(32768.0)
+    if sig.shape[0] > 1:
+        sig = sig.mean(dim=0, keepdim=True)
+    return _ensure_16k(sig, sr)
+
+
+def load_audio(audio_path: str, max_seconds: Optional[float] = None) -> torch.Tensor:
+    """
+    Load an audio file as a mono 16 kHz waveform batch.
+
+    Args:
+        audio_path (str): Path to the audio file.
+        max_seconds (Optional[float]): If set, only a window of this length
+            taken from the middle of the file is read.
+
+    Returns:
+        torch.Tensor: Waveform of shape ``[1, time]``.
+    """
+    mapped = _mmap_wav(audio_path)
+    if mapped is not None:
+        samples, sr = mapped
+        return prepare_waveform(torch.from_numpy(samples).T, sr, max_seconds)
+
+    frame_offset, num_frames = 0, -1
+    if max_seconds is not None:
+        info = torchaudio.info(audio_path)
+        window = int(max_seconds * info.sample_rate)
+        if 0 < window < info.num_frames:
+            frame_offset, num_frames = (info.num_frames - window) // 2, window
+
+    sig, sr = torchaudio.load(audio_path, frame_offset=frame_offset, num_frames=num_frames)
+    # Still clip here: num_frames can be 0/unknown for compressed formats,
+    # in which case the whole file was decoded above
+    return prepare_waveform(sig, sr, max_seconds)
+
+
+@lru_cache(maxsize=16)
+def _resampler(orig_sr: int, new_sr: int) -> torchaudio.transforms.Resample:
+    """Build (once per rate pair) the torchaudio resampler and its sinc kernel."""
+    return torchaudio.transforms.Resample(orig_sr, new_sr, dtype=torch.float32)
+
+
+def _ensure_16k(sig: torch.Tensor, sr: int) -> torch.Tensor:
+    """
+    Resample a ``[1, time]`` waveform to 16 kHz, using soxr when it is installed.
+
+    Args:
+        sig (torch.Tensor): Mono waveform.
+        sr (int): Sample rate of ``sig``.
+
+    Returns:
+        torch.Tensor: Waveform at 16 kHz (``sig`` itself if already 16 kHz).
+    """
+    if sr == SAMPLE_RATE:
+        return sig
+    if soxr is None:
+        return _resampler(int(sr), SAMPLE_RATE)(sig)
+    resampled = soxr.resample(sig[0].numpy(), sr, SAMPLE_RATE, quality="HQ")
+    return torch.from_numpy(resampled).unsqueeze(0)
+
+
+def _classify_waveforms(sigs: List[torch.Tensor], return_probs: bool = False) -> List[Dict[str, Any]]:
+    """
+    Classify a list of ``[1, time]`` waveforms, batching those of equal length.
+
+    SpeechBrain runs the wav2vec2 encoder without an attention mask, so zero
+    padding would leak into self-attention and make a clip's score depend on
+    what it was batched with. Only waveforms of identical length (e.g. every
+    file clipped to MAX_SECONDS) share a forward pass; the rest run alone.
+
+    Args:
+        sigs (List[torch.Tensor]): Mono 16 kHz waveforms.
+        return_probs (bool): Also build the per-label "probabilities" mapping.
+
+    Returns:
+        List[dict]: One result dictionary per waveform, in input order.
+    """
+    if not sigs:
+        return []
+
+    classifier = get_classifier()
+    device = get_device()
+    labels = classifier.hparams.label_encoder.labels
+
+    groups: Dict[int, List[int]] = {}
+    for i, sig in enumerate(sigs):
+        groups.setdefault(sig.shape[-1], []).append(i)
+
+    results: List[Dict[str, Any]] = [{} for _ in sigs]
+    for indices in groups.values():
+        batch = torch.cat([sigs[i] for i in indices]).to(device)
+        wav_lens = torch.ones(len(indices), device=device)
+
+        # Run classification (FP16 autocast only applies on CUDA)
+        with _inference_context(device):
+            out_prob, score, _, text_lab = classifier.classify_batch(batch, wav_lens)
+
+            # One device-to-host copy per tensor instead of a sync per element
+            scores = score.float().cpu().tolist()
+            probs = out_prob.float().cpu().tolist() if return_probs else None
+
+        for j, i in enumerate(indices):
+            accent = text_lab[j]
+            confidence = scores[j]
+
+            summary = f"Detected accent: {accent.capitalize()} with confidence {confidence:.2%}"
+
+            result = {
+                "summary": summary,
+                "accent": accent,
+                "confidence": confidence,
+            }
+            if return_probs:
+                # Map each label to its corresponding probability for this sample
+                result["probabilities"] = dict(zip(labels, probs[j]))
+            results[i] = result
+    return results
+
+
+def classify_accent(
+    audio_path: Optional[str] = None,
+    max_seconds: Optional[float] = MAX_SECONDS,
+    sig: Optional[torch.Tensor] = None,
+    sr: Optional[int] = None,
+    return_probs: bool = False,
+) -> Dict[str, Any]:
+    """
+    Classify the English accent from an audio file or an already-loaded waveform.
+
+    Args:
+        audio_path (Optional[str]): Path to the audio WAV file.
+        max_seconds (Optional[float]): Maximum audio duration fed to the model;
+            longer files are clipped to their middle section. None disables clipping.
+        sig (Optional[torch.Tensor]): Waveform ``[channels, time]`` used instead
+            of ``audio_path``, e.g. as returned by ``torchaudio.load``.
+        sr (Optional[int]): Sample rate of ``sig``; required with ``sig``.
+        return_probs (bool): Include the per-accent "probabilities" mapping.
 
     Returns:
         dict: Result dictionary containing:
             - "summary" (str): Human-readable summary.
             - "accent" (str): Predicted accent label.
             - "confidence" (float): Confidence score between 0 and 1.
-            - "probabilities" (dict): Mapping of accents to their probabilities.
+            - "probabilities" (dict): Mapping of accents to their probabilities
+              (only when ``return_probs`` is True).
     
     Raises:
+        ValueError: If neither ``audio_path`` nor ``sig`` and ``sr`` are given.
         Exception: If classification fails.
     """
-    classifier = get_classifier()
-
-    # Run classification
-    out_prob, score, _, text_lab = classifier.classify_file(audio_path)
+    if sig is not None and sr is not None:
+        waveform = prepare_waveform(sig, sr, max_seconds)
+    elif audio_path is not None:
+        # Audio extracted by this module is already 16 kHz mono, so loading it
+        # directly skips the decode/resample pass done by classify_file
+        waveform = load_audio(audio_path, max_seconds)
+    else:
+        raise ValueError("Provide either audio_path or both sig and sr")
+    return _classify_waveforms([waveform], return_probs)[0]
 
-    labels = classifier.hparams.label_encoder.labels
 
-    # Map each label to its corresponding probability for first sample
-    probabilities = {label: float(prob) for label, prob in zip(labels, out_prob[0])}
+def classify_accents_batch(
+    audio_paths: Optional[List[str]] = None,
+    max_seconds: Optional[float] = MAX_SECONDS,
+    waveforms: Optional[List[Tuple[torch.Tensor, int]]] = None,
+    return_probs: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Classify the English accent of several audio files in one batch.
 
-    accent = text_lab[0]
-    confidence = float(score[0])
+    Args:
+        audio_paths (Optional[List[str]]): Paths to the audio WAV files.
+        max_seconds (Optional[float]): Maximum duration per file; see classify_accent.
+        waveforms (Optional[List[Tuple[torch.Tensor, int]]]): ``(sig, sr)`` pairs
+            used instead of ``audio_paths``.
+        return_probs (bool): Include the per-accent "probabilities" mapping.
 
-    summary = f"Detected accent: {accent.capitalize()} with confidence {confidence:.2%}"
+    Returns:
+        List[dict]: One result dictionary (as returned by classify_accent) per input.
 
-    return {
-        "summary": summary,
-        "accent": accent,
-        "confidence": confidence,
-        "probabilities": probabilities,
-    }
+    Raises:
+        ValueError: If neither ``audio_paths`` nor ``waveforms`` is given.
+        Exception: If classification fails.
+    """
+    if waveforms is not None:
+        sigs = [prepare_waveform(sig, sr, max_seconds) for sig, sr in waveforms]
+    elif audio_paths is not None:
+        sigs = [load_audio(path, max_seconds) for path in audio_paths]
+    else:
+        raise ValueError("Provide either audio_paths or waveforms")
+    return _classify_waveforms(sigs, return_probs)
 
 
 def cleanup_files(*paths: Optional[str]) -> None:
     """
-    Delete temporary files if they exist.
+    Delete temporary files, ignoring any that are already gone.
 
     Args:
         *paths (str): Paths to files to delete.
     """
     for path in paths:
-        if path and os.path.exists(path):
+        if path:
             try:
-                os.remove(path)
+                os.unlink(path)
             except OSError:
                 pass
 
@@ -146,8 +794,19 @@ def detect_accent_from_url(url: str) -> Optional[Dict[str, Any]]:
     tmp_video_path = None
     tmp_audio_path = None
     try:
-        tmp_video_path = download_video(url)
-        tmp_audio_path = extract_audio(tmp_video_path)
+        if _ffmpeg_exe() is None:
+            # Nothing to pipe into; decode from a downloaded file with PyAV
+            tmp_video_path = download_video(url)
+            tmp_audio_path = extract_audio(tmp_video_path)
+        else:
+            with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as tmp_file:
+                tmp_video_path = tmp_file.name
+            try:
+                tmp_audio_path = download_audio(url, tmp_video_path)
+            except subprocess.CalledProcessError:
+                # Some containers can't be demuxed from a pipe; decode the copy
+                # saved during the download from a seekable file instead
+                tmp_audio_path = extract_audio(tmp_video_path)
         return classify_accent(tmp_audio_path)
     except Exception as e:
         st.error(f"Failed to process the video URL: {e}")
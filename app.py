@@ -6,9 +6,14 @@ app.py: Streamlit UI for English accent detection from video URLs or local files
 import streamlit as st
 import tempfile
 import os
-import torchaudio
-from moviepy import VideoFileClip
-from accent_detector import classify_accent, detect_accent_from_url
+from accent_detector import (
+    classify_accents_batch,
+    cleanup_files,
+    detect_accent_from_url,
+    ffmpeg_extract,
+    get_classifier,
+    open_audio,
+)
 
 
 def process_audio_file(file_path: str, file_ext: str) -> str:
@@ -19,11 +24,8 @@ def process_audio_file(file_path: str, file_ext: str) -> str:
     """
     if file_ext in [".mp4", ".mkv", ".mov", ".m4a"]:
         st.info("Extracting audio from video…")
-        clip = VideoFileClip(file_path)
         audio_path = file_path + ".wav"
-        clip.audio.write_audiofile(
-            audio_path, verbose=False, logger=None, codec="pcm_s16le", fps=16000
-        )
+        ffmpeg_extract(file_path, audio_path)
         return audio_path
 
     elif file_ext in [".mp3", ".wav"]:
@@ -34,16 +36,6 @@ def process_audio_file(file_path: str, file_ext: str) -> str:
         raise ValueError(f"Unsupported file format: {file_ext}")
 
 
-def cleanup_files(*file_paths: str) -> None:
-    """Remove temporary files if they exist."""
-    for path in file_paths:
-        if path and os.path.exists(path):
-            try:
-                os.remove(path)
-            except OSError:
-                pass
-
-
 st.set_page_config(page_title="English Accent Detector", page_icon="🗣️", layout="centered")
 
 st.title("🎯 English Accent Detection from Video or Audio")
@@ -54,39 +46,65 @@ Upload an audio/video file or paste a **public video URL**, and the app will:
 2. Detect the speaker's English accent using a deep learning model.
 """)
 
-uploaded_file = st.file_uploader(
-    "Upload audio/video file", type=["mp4", "mp3", "wav", "m4a", "mov", "mkv"]
+# Load (and warm up) the model when the app starts rather than on the first
+# analysis; st.cache_resource makes this a no-op on later reruns.
+try:
+    with st.spinner("Loading accent model…"):
+        get_classifier()
+except Exception as e:
+    st.error(f"Failed to load the accent model: {e}")
+    st.stop()
+
+uploaded_files = st.file_uploader(
+    "Upload audio/video files",
+    type=["mp4", "mp3", "wav", "m4a", "mov", "mkv"],
+    accept_multiple_files=True,
 )
 url_input = st.text_input("Or paste a public video URL to analyze")
+show_probs = st.checkbox("Show probabilities for every accent")
 
-# Process uploaded file
-if uploaded_file is not None:
-    tmp_path = audio_path = None
+# Process uploaded files
+if uploaded_files:
+    tmp_paths, audio_paths, waveforms = [], [], []
     try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(uploaded_file.name)[1]) as tmp:
-            tmp.write(uploaded_file.read())
-            tmp_path = tmp.name
+        for uploaded_file in uploaded_files:
+            with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(uploaded_file.name)[1]) as tmp:
+                tmp.write(uploaded_file.read())
+                tmp_paths.append(tmp.name)
 
-        file_ext = os.path.splitext(tmp_path)[1].lower()
-        audio_path = process_audio_file(tmp_path, file_ext)
+            file_ext = os.path.splitext(tmp.name)[1].lower()
+            audio_path = process_audio_file(tmp.name, file_ext)
+            audio_paths.append(audio_path)
 
-        st.audio(audio_path, format="audio/wav")
-        waveform, sample_rate = torchaudio.load(audio_path)
-        st.write(f"Sample Rate: {sample_rate}, Waveform shape: {tuple(waveform.shape)}")
+            st.audio(audio_path, format="audio/wav")
+            waveform, sample_rate = open_audio(audio_path)
+            waveforms.append((waveform, sample_rate))
+            st.write(f"{uploaded_file.name} — Sample Rate: {sample_rate}, Waveform shape: {tuple(waveform.shape)}")
 
         st.subheader("Accent Detection Result")
         with st.spinner("Analyzing audio…"):
-            result = classify_accent(audio_path)
-
-        st.success(result["summary"])
-        st.metric("Detected Accent", result["accent"].capitalize())
-        st.metric("Confidence", f"{result['confidence']:.2%}")
+            # Reuse the waveforms loaded above instead of decoding each file again
+            results = classify_accents_batch(waveforms=waveforms, return_probs=show_probs)
+
+        for uploaded_file, result in zip(uploaded_files, results):
+            if len(uploaded_files) > 1:
+                st.markdown(f"**{uploaded_file.name}**")
+            st.success(result["summary"])
+            st.metric("Detected Accent", result["accent"].capitalize())
+            st.metric("Confidence", f"{result['confidence']:.2%}")
+            if show_probs:
+                with st.expander("Probabilities"):
+                    st.bar_chart(result["probabilities"])
 
     except Exception as e:
         st.error(f"Error processing file: {e}")
 
     finally:
-        cleanup_files(tmp_path, audio_path)
+        # Release the memory-mapped waveforms first; mapped files can't be
+        # deleted on Windows
+        waveforms.clear()
+        waveform = None
+        cleanup_files(*tmp_paths, *audio_paths)
 
 # Process URL input
 elif url_input: